@@ -19,47 +19,156 @@ test.py — one-shot 부트스트랩 + BOJ 로그인 + 시험 세팅 스크립
 # ------------------------------------------------------------
 # 0) 부트스트랩: 패키지 설치
 # ------------------------------------------------------------
-import sys, subprocess, shutil, os, platform, time, re, json, random, hashlib
+import sys, subprocess, shutil, os, platform, time, re, json, random, hashlib, threading, functools
+import importlib.util as _ilu
+from concurrent.futures import ThreadPoolExecutor, Future
 from datetime import datetime
 from html import unescape
 from typing import Dict, List, Tuple
 
 def _pip_install(*pkgs):
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", *pkgs])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade",
+                               "--disable-pip-version-check", "--no-input", *pkgs])
     except Exception as e:
         print(f"[error] pip install 실패: {pkgs}\n{e}")
         raise
 
-# 필수 파이썬 패키지
-try:
-    import requests  # noqa
-except Exception:
-    _pip_install("requests>=2.31")
-    import requests
+# 제3자 패키지 핸들 — 모듈 import 시점에는 아무것도 설치/로드하지 않고,
+# main()이 _ensure_deps()를 호출할 때 채운다. (--help 같은 경로는 공짜)
+requests = None
+yaml = None
+_YamlLoader = None
+_YamlDumper = None
+_HTMLParser = None      # selectolax(C 파서) — 없으면 정규식 폴백
+_markdownify = None     # markdownify — 없으면 html2text
+BOJ_CMD = None          # boj 실행 커맨드 (PATH에 없으면 python -m boj)
+_BOJ_BIN = None         # shutil.which("boj") 결과 캐시 — $PATH 순회를 1회로
+
+def _ensure_deps():
+    """필수 패키지를 확인/설치하고 전역 핸들을 구성한다. main()에서 1회 호출."""
+    global requests, yaml, _YamlLoader, _YamlDumper
+    global _HTMLParser, _markdownify, BOJ_CMD, _BOJ_BIN
+    if requests is not None:
+        return
 
-try:
-    import yaml  # noqa
-except Exception:
-    _pip_install("PyYAML>=6.0")
-    import yaml
+    # 존재 여부는 find_spec으로만 확인 — 실패-후-재시도 import보다 싸고,
+    # 모듈 init 코드를 실행하지 않는다. 누락분을 전부 모아 pip을 1회만
+    # 띄운다(호출마다 리졸버 기동에 수 초가 든다).
+    missing = [spec for mod, spec in (
+        ("requests", "requests>=2.31"),
+        ("yaml", "PyYAML>=6.0"),
+        ("html2text", "html2text>=2020.1.16"),
+    ) if _ilu.find_spec(mod) is None]
+    # which()는 $PATH를 끝까지 훑는다(os.stat 수십 회) — 결과를 캐시해 재사용
+    _BOJ_BIN = shutil.which("boj")
+    if _BOJ_BIN is None:
+        missing.append("boj-cli>=1.2")
+    # 선택 패키지 — 설치 실패해도 폴백이 있으므로 치명적이지 않다
+    optional = [spec for mod, spec in (
+        ("selectolax", "selectolax>=0.3"),
+        ("markdownify", "markdownify>=0.11"),
+    ) if _ilu.find_spec(mod) is None]
+    if missing or optional:
+        try:
+            _pip_install(*missing, *optional)
+        except Exception:
+            # 선택 패키지 빌드 실패가 전체를 막지 않도록 필수만 재시도
+            if missing:
+                _pip_install(*missing)
 
-try:
-    import html2text  # noqa
-except Exception:
-    _pip_install("html2text>=2020.1.16")
-    import html2text
+    import requests as _requests
+    requests = _requests
 
-# boj-cli 확인/설치
-if shutil.which("boj") is None:
-    _pip_install("boj-cli>=1.2")
+    import yaml as _yaml
+    yaml = _yaml
+    # libyaml C 바인딩이 있으면 파싱/덤프가 10배 이상 빠르다 — 없으면 순수 파이썬
+    try:
+        from yaml import CSafeLoader as _loader, CSafeDumper as _dumper
+    except ImportError:
+        from yaml import SafeLoader as _loader, SafeDumper as _dumper
+    _YamlLoader, _YamlDumper = _loader, _dumper
 
-# boj 실행 커맨드 (PATH에 없으면 python -m boj)
-BOJ_CMD = ["boj"] if shutil.which("boj") else [sys.executable, "-m", "boj"]
+    # html2text는 설치만 보장됐고 import는 to_markdown 폴백이 처음 쓸 때 한다
+
+    # selectolax(C 파서)는 있으면 사용, 없으면 정규식 폴백
+    try:
+        from selectolax.parser import HTMLParser as _parser
+        _HTMLParser = _parser
+    except Exception:
+        _HTMLParser = None
+
+    # markdownify가 있으면 HTML→Markdown 변환에 사용, 없으면 html2text
+    try:
+        from markdownify import markdownify as _md
+        _markdownify = _md
+    except Exception:
+        _markdownify = None
+
+    if _BOJ_BIN is None and "boj-cli>=1.2" in missing:
+        _BOJ_BIN = shutil.which("boj")  # 방금 설치됐을 수 있으니 한 번만 재확인
+    BOJ_CMD = [_BOJ_BIN] if _BOJ_BIN else [sys.executable, "-m", "boj"]
 
 # ------------------------------------------------------------
 # 1) solved.ac / 공통 유틸
 # ------------------------------------------------------------
+# 캐시 루트(HTTP sqlite 캐시 / 문제 섹션 캐시가 모두 이 아래에 들어간다)
+CACHE_ROOT = os.path.join(".cache", "boj")
+
+# 공용 HTTP 세션 — keep-alive로 TCP/TLS 핸드셰이크를 재사용하고,
+# 커넥션 풀 + 재시도 정책을 한 곳에서 관리한다. 실제 네트워크가 필요해질
+# 때까지 만들지 않는다(지연 생성, 스레드 안전).
+#
+# requests-cache가 있으면 HTTP 계층 자체를 sqlite 캐시로 감싼다.
+# solved.ac 검색은 1시간, BOJ 문제 페이지는 30일(지문은 사실상 불변).
+# `--refresh`로 시작 시 캐시를 비울 수 있다.
+SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# 동시 아웃바운드 요청 상한 — 스레드 수와 무관하게 solved.ac와 BOJ를 합쳐
+# 동시에 8개까지만 연결한다(예의 있는 레이트 리밋)
+_FETCH_SEM = threading.BoundedSemaphore(8)
+
+def _get_session():
+    global SESSION
+    if SESSION is not None:
+        return SESSION
+    with _SESSION_LOCK:
+        if SESSION is not None:
+            return SESSION
+        _ensure_deps()
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        try:
+            import requests_cache  # noqa
+        except Exception:
+            requests_cache = None
+
+        if requests_cache is not None:
+            sess = requests_cache.CachedSession(
+                os.path.join(CACHE_ROOT, "http"),
+                backend="sqlite",
+                expire_after=86400,
+                urls_expire_after={
+                    "*.solved.ac": 3600,
+                    "solved.ac": 3600,
+                    "*.acmicpc.net/problem/*": 30 * 86400,
+                },
+            )
+            if "--refresh" in sys.argv:
+                sess.cache.clear()
+        else:
+            sess = requests.Session()
+        sess.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.8,
+                              status_forcelist=[429, 500, 502, 503, 504]),
+        ))
+        SESSION = sess
+        return SESSION
+
 SOLVED_AC_SEARCH = "https://solved.ac/api/v3/search/problem"
 
 TIER_ORDER = [
@@ -85,6 +194,7 @@ DIFFICULTY_PRESETS = {
     "hard": ["mid",   "hard", "insane"],
 }
 
+@functools.lru_cache(maxsize=64)
 def parse_tier_range(expr: str) -> Tuple[int, int]:
     s = expr.replace(" ", "").upper()
     if "~" in s:
@@ -113,68 +223,134 @@ def build_query(tier_expr: str, tags: List[str]) -> str:
     return " ".join(q)
 
 def fetch_candidates(query: str, max_pages: int = 3, size: int = 100) -> List[Dict]:
-    items_all: List[Dict] = []
-    for page in range(1, max_pages+1):
-        r = requests.get(SOLVED_AC_SEARCH, params={"query": query, "page": page, "size": size}, timeout=12)
+    # 페이지는 서로 독립이므로 한꺼번에 요청하고, 결과는 순서대로 합친다
+    # (뒤쪽 페이지가 비거나 오류면 그 뒤는 버림)
+    def _get_page(page: int):
+        with _FETCH_SEM:
+            r = _get_session().get(SOLVED_AC_SEARCH, params={"query": query, "page": page, "size": size}, timeout=12)
         if r.status_code != 200:
             print(f"[warn] solved.ac 응답 {r.status_code}: {r.text[:200]}")
+            return None
+        return r.json().get("items", [])
+
+    with ThreadPoolExecutor(max_workers=max_pages) as ex:
+        pages = list(ex.map(_get_page, range(1, max_pages + 1)))
+
+    # 페이지를 순회하며 problemId 키 dict로 곧바로 중복 제거 — 정렬은 마지막 한 번만
+    uniq: Dict[int, Dict] = {}
+    for items in pages:
+        if items is None:
             break
-        data = r.json()
-        items = data.get("items", [])
-        items_all.extend(items)
+        for it in items:
+            pid = it.get("problemId")
+            if pid:
+                uniq.setdefault(pid, it)
         if len(items) < size: break
-    items_all.sort(key=lambda x: x.get("problemId", 0))
-    uniq = {}
-    for it in items_all:
-        pid = it.get("problemId")
-        if pid and pid not in uniq:
-            uniq[pid] = it
-    return list(uniq.values())
+    return sorted(uniq.values(), key=lambda x: x["problemId"])
+
+# orjson(Rust 구현)이 있으면 JSON 읽기/쓰기에 사용 — 없으면 표준 json
+try:
+    import orjson  # noqa
+except Exception:
+    orjson = None
+
+# zstandard가 있으면 pool 스냅샷을 .json.zst로 압축 저장(2~5배 작음)
+try:
+    import zstandard as zstd  # noqa
+except Exception:
+    zstd = None
+
+def _dump_json_bytes(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _parse_json_bytes(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 def save_json(path: str, obj):
     os.makedirs(os.path.dirname(path), exist_ok=True)
+    if path.endswith(".zst"):
+        with open(path, "wb") as f:
+            f.write(zstd.ZstdCompressor(level=10).compress(_dump_json_bytes(obj)))
+        return
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(obj, f, ensure_ascii=False, indent=2)
 
 def load_json(path: str, default=None):
     if not os.path.exists(path):
         return default
+    if path.endswith(".zst"):
+        with open(path, "rb") as f:
+            return _parse_json_bytes(zstd.ZstdDecompressor().decompress(f.read()))
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 # ------------------------------------------------------------
 # 2) BOJ 설정 파일(.boj/config.yaml) 유틸
 # ------------------------------------------------------------
-def find_boj_config_path() -> str:
-    cwd_conf = os.path.join(os.getcwd(), ".boj", "config.yaml")
-    if os.path.exists(cwd_conf):
-        return cwd_conf
-    return os.path.expanduser("~/.boj/config.yaml")
+# 설정 경로/내용 캐시 — 경로 탐색(stat 2회)과 YAML 파싱을 런당 한 번으로.
+# switch_boj_default_filetype이 파일을 바꾸면 명시적으로 비운다.
+_CONF_PATH_CACHE: Dict[str, str] = {}
+_CONF_CACHE: Dict[Tuple[str, float], Dict] = {}
 
-def load_boj_config():
-    path = find_boj_config_path()
+def _invalidate_conf_caches():
+    _CONF_PATH_CACHE.clear()
+    _CONF_CACHE.clear()
+
+def find_boj_config_path() -> str:
+    cwd = os.getcwd()
+    cached = _CONF_PATH_CACHE.get(cwd)
+    if cached is not None:
+        return cached
+    cwd_conf = os.path.join(cwd, ".boj", "config.yaml")
+    path = cwd_conf if os.path.exists(cwd_conf) else os.path.expanduser("~/.boj/config.yaml")
+    _CONF_PATH_CACHE[cwd] = path
+    return path
+
+def _load_boj_config_cached(path: str, mtime: float):
+    # mtime을 캐시 키에 포함 → 파일이 바뀌면 자동으로 다시 파싱된다
+    key = (path, mtime)
+    if key in _CONF_CACHE:
+        return _CONF_CACHE[key]
     conf = {}
     if os.path.exists(path):
         try:
             with open(path, "r", encoding="utf-8") as f:
-                conf = yaml.safe_load(f) or {}
+                conf = yaml.load(f, Loader=_YamlLoader) or {}
         except Exception:
             conf = {}
-    return conf, path
+    _CONF_CACHE[key] = conf
+    return conf
+
+def load_boj_config():
+    path = find_boj_config_path()
+    mtime = os.path.getmtime(path) if os.path.exists(path) else 0.0
+    return _load_boj_config_cached(path, mtime), path
 
 def get_ongoing_dir() -> str:
     conf, _ = load_boj_config()
     ws = (conf or {}).get("workspace", {})
     return ws.get("ongoing_dir", "problems") or ""
 
-def resolve_problem_dir(problem_id: int) -> str:
+def resolve_ongoing_base() -> str:
     ongoing_dir = get_ongoing_dir()
     if os.path.isabs(ongoing_dir):
-        base_dir = ongoing_dir
-    elif ongoing_dir in ("", "."):
-        base_dir = os.getcwd()
-    else:
-        base_dir = os.path.join(os.getcwd(), ongoing_dir)
+        return ongoing_dir
+    if ongoing_dir in ("", "."):
+        return os.getcwd()
+    return os.path.join(os.getcwd(), ongoing_dir)
+
+def resolve_problem_dir(problem_id: int, ongoing_base: str = None) -> str:
+    # 루프 안에서 매번 config를 뒤지지 않도록 호출자가 base를 넘길 수 있다
+    base_dir = ongoing_base if ongoing_base is not None else resolve_ongoing_base()
     return os.path.join(base_dir, str(problem_id))
 
 def switch_boj_default_filetype(lang_key: str):
@@ -182,7 +358,7 @@ def switch_boj_default_filetype(lang_key: str):
     os.makedirs(os.path.dirname(conf_path), exist_ok=True)
     try:
         with open(conf_path, "r", encoding="utf-8") as f:
-            conf = yaml.safe_load(f) or {}
+            conf = yaml.load(f, Loader=_YamlLoader) or {}
     except Exception:
         conf = {}
 
@@ -220,8 +396,25 @@ def switch_boj_default_filetype(lang_key: str):
     if lang_key in ("py","cpp","java"):
         conf["general"]["default_filetype"] = lang_key
 
-    with open(conf_path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(conf, f, allow_unicode=True, sort_keys=False)
+    # 직렬화 결과 바이트가 그대로면 파일을 건드리지 않는다
+    # (불필요한 디스크 쓰기 + 파일 워처 트리거 방지)
+    new_bytes = yaml.dump(conf, Dumper=_YamlDumper,
+                          allow_unicode=True, sort_keys=False).encode("utf-8")
+    try:
+        with open(conf_path, "rb") as f:
+            old_bytes = f.read()
+    except FileNotFoundError:
+        old_bytes = b""
+    if new_bytes == old_bytes:
+        print(f"[i] {conf_path} 변경 사항 없음 — 그대로 둡니다.")
+        return
+
+    # 임시 파일 + os.replace로 원자적 교체 — 중간에 죽어도 config가 잘리지 않는다
+    tmp_path = conf_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(new_bytes)
+    os.replace(tmp_path, conf_path)
+    _invalidate_conf_caches()
 
     print(f"[ok] {conf_path} 기본 언어를 '{lang_key}'로 설정했습니다.")
 
@@ -231,13 +424,41 @@ def switch_boj_default_filetype(lang_key: str):
 def _run(cmd, cwd=None):
     return subprocess.run(cmd, check=False, capture_output=True, text=True, cwd=cwd)
 
+# boj-cli 기능 프로브 캐시 — `boj help` 서브프로세스(런당 100~300ms)를
+# 바이너리(경로/mtime/크기)가 바뀌기 전까지 다시 돌리지 않는다.
+_CLI_CAPS_PATH = os.path.expanduser("~/.boj_cache/cli_caps.json")
+
+def _boj_cli_caps(need_add_probe: bool = False) -> Dict:
+    # _ensure_deps()가 이미 경로를 찾아뒀으면 $PATH를 다시 훑지 않는다
+    bin_path = _BOJ_BIN if BOJ_CMD is not None else shutil.which("boj")
+    key = None
+    if bin_path is not None:
+        st = os.stat(bin_path)
+        key = [bin_path, st.st_mtime, st.st_size]
+    cached = load_json(_CLI_CAPS_PATH, None)
+    if cached and cached.get("key") == key and (not need_add_probe or "add_multi" in cached):
+        return cached
+    help_out = _run(BOJ_CMD + ["help"])
+    caps = {
+        "key": key,
+        "has_whoami": help_out.returncode == 0 and "whoami" in (help_out.stdout or ""),
+    }
+    if need_add_probe:
+        # `boj add`가 ID를 여러 개 받는 버전인지(인자 표기에 '...'가 있는지) 확인
+        add_help = _run(BOJ_CMD + ["add", "--help"])
+        caps["add_multi"] = bool(add_help.returncode == 0 and "..." in (add_help.stdout or ""))
+    try:
+        save_json(_CLI_CAPS_PATH, caps)
+    except Exception:
+        pass  # 캐시 저장 실패는 치명적이지 않다
+    return caps
+
 def is_boj_logged_in() -> bool | None:
     """
     boj-cli가 'whoami'를 지원하면 True/False를 반환.
     지원하지 않으면 None을 반환(확인 불가).
     """
-    help_out = _run(BOJ_CMD + ["help"])
-    if help_out.returncode == 0 and "whoami" in (help_out.stdout or ""):
+    if _boj_cli_caps().get("has_whoami"):
         r = _run(BOJ_CMD + ["whoami"])
         # whoami가 존재할 때만 판정. 출력이 있으면 로그인된 것으로 간주.
         return r.returncode == 0 and bool((r.stdout or "").strip())
@@ -274,21 +495,49 @@ def ensure_boj_login():
 # ------------------------------------------------------------
 # 4) BOJ 문제 페이지 → Markdown
 # ------------------------------------------------------------
+# 변환기 구성은 첫 사용 시 한 번만 한다. html2text 인스턴스는 상태를
+# 가지므로 폴백 경로는 락으로 감싼다(markdownify는 무상태 함수).
+_H2T = None
+_H2T_LOCK = threading.Lock()
+
+def to_markdown(h: str) -> str:
+    if not h:
+        return ""
+    if _markdownify is not None:
+        return _markdownify(unescape(h), heading_style="ATX").strip()
+    global _H2T
+    with _H2T_LOCK:
+        if _H2T is None:
+            _ensure_deps()
+            import html2text
+            _H2T = html2text.HTML2Text()
+            _H2T.ignore_links = False
+            _H2T.body_width = 0
+        return _H2T.handle(unescape(h)).strip()
+
+# 요청 헤더는 매 호출 새로 만들 필요가 없으니 모듈 상수로 — gzip 수락으로
+# 전송량도 줄인다(200 KB대 문제 페이지가 수십 KB로)
+BOJ_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                   "AppleWebKit/537.36 (KHTML, like Gecko) "
+                   "Chrome/122.0.0.0 Safari/537.36"),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Referer": "https://www.acmicpc.net/",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+}
+
+# URL 단위 메모리 캐시(L1) — 디스크 섹션 캐시(L2) 앞단에서 같은 프로세스 내
+# 재요청을 차단한다. 실패(예외)는 캐시되지 않고, maxsize로 메모리 사용을 제한.
+@functools.lru_cache(maxsize=256)
 def _http_get_with_headers(url: str, tries: int = 3, timeout: int = 12) -> str:
-    headers = {
-        "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                       "AppleWebKit/537.36 (KHTML, like Gecko) "
-                       "Chrome/122.0.0.0 Safari/537.36"),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-        "Referer": "https://www.acmicpc.net/",
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
-    }
     last_err = None
     for i in range(tries):
         try:
-            r = requests.get(url, headers=headers, timeout=timeout)
+            with _FETCH_SEM:
+                r = _get_session().get(url, headers=BOJ_HEADERS, timeout=timeout)
             if r.status_code == 200:
                 return r.text
             last_err = f"{r.status_code} {r.reason}"
@@ -297,132 +546,274 @@ def _http_get_with_headers(url: str, tries: int = 3, timeout: int = 12) -> str:
         time.sleep(0.8 * (i + 1))
     raise RuntimeError(f"GET 실패: {last_err}")
 
-def _extract_div(html: str, div_id: str) -> str:
-    m = re.search(rf'<div id="{re.escape(div_id)}"[^>]*>(.*?)</div>', html, re.S | re.I)
-    return m.group(1).strip() if m else ""
+# 핫 패스에서 쓰는 패턴은 모듈 로드 시 한 번만 컴파일한다
+TAG_RE = re.compile(r'<[^>]+>')
+
+def _strip_tags(h: str) -> str:
+    # <pre> 예제처럼 사실상 평문인 조각은 Markdown 변환기 대신 태그 제거 + 엔티티 해제만
+    return unescape(TAG_RE.sub('', h)).strip()
+
+# 정규식 폴백용 단일 패턴 — 섹션 div 3개와 예제 pre들을 전부 한 번의
+# 스캔(finditer)으로 걷는다(섹션별 full-scan 5회 → 1회)
+_PAGE_RE = re.compile(
+    r'<div id="(problem_description|problem_input|problem_output)"[^>]*>(.*?)</div>'
+    r'|<pre[^>]*id="sample-(input|output)-(\d+)"[^>]*>(.*?)</pre>',
+    re.S | re.I)
+
+# 문제 페이지 파싱 결과 디스크 캐시 — BOJ 문제 지문은 사실상 불변이라
+# 한 번 받은 문제는 재실행 시 HTTP/파싱 없이 json.load 한 번으로 끝난다.
+# `--no-cache`로 우회 가능.
+SECTIONS_CACHE_DIR = CACHE_ROOT
+SECTIONS_CACHE_TTL_DAYS = 30
+NO_CACHE = "--no-cache" in sys.argv
+
+# 요청 실패 시 description에 들어가는 플레이스홀더의 머리말 — 이 표식이 있는
+# 결과는 어떤 캐시/파일에도 눌러앉으면 안 된다(다음 실행에서 재시도)
+_FETCH_ERR_PREFIX = "(문제 페이지 요청 오류"
+
+# 원본 HTML도 같은 TTL로 보관 — 섹션 캐시가 없어도(포맷 변경 등) 재파싱만으로 복구
+HTML_CACHE_DIR = os.path.join(CACHE_ROOT, "html")
+
+def _load_cached_html(problem_id: int):
+    if NO_CACHE:
+        return None
+    path = os.path.join(HTML_CACHE_DIR, f"{problem_id}.html")
+    if os.path.exists(path):
+        age_days = (time.time() - os.path.getmtime(path)) / 86400
+        if age_days < SECTIONS_CACHE_TTL_DAYS:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+    return None
+
+def _store_cached_html(problem_id: int, html: str):
+    if NO_CACHE:
+        return
+    os.makedirs(HTML_CACHE_DIR, exist_ok=True)
+    with open(os.path.join(HTML_CACHE_DIR, f"{problem_id}.html"), "w", encoding="utf-8") as f:
+        f.write(html)
+
+# 동시 호출 단일화(single-flight) — 여러 스레드가 같은 problemId를 동시에
+# 요청하면 첫 호출만 실제로 가져오고 나머지는 그 Future 결과를 공유한다.
+_INFLIGHT: Dict[int, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
 
 def fetch_problem_sections(problem_id: int) -> Dict[str, str]:
+    with _INFLIGHT_LOCK:
+        fut = _INFLIGHT.get(problem_id)
+        leader = fut is None
+        if leader:
+            fut = Future()
+            _INFLIGHT[problem_id] = fut
+    if not leader:
+        return fut.result()
+    try:
+        sec = _fetch_problem_sections_cached(problem_id)
+        fut.set_result(sec)
+        return sec
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(problem_id, None)
+
+def _fetch_problem_sections_cached(problem_id: int) -> Dict[str, str]:
+    cache_path = os.path.join(SECTIONS_CACHE_DIR, f"{problem_id}.json")
+    if not NO_CACHE and os.path.exists(cache_path):
+        age_days = (time.time() - os.path.getmtime(cache_path)) / 86400
+        if age_days < SECTIONS_CACHE_TTL_DAYS:
+            cached = load_json(cache_path, None)
+            if cached:
+                return cached
+    sec = _fetch_problem_sections(problem_id)
+    if not NO_CACHE and not sec["description"].startswith(_FETCH_ERR_PREFIX):
+        save_json(cache_path, sec)
+    return sec
+
+def _fetch_problem_sections(problem_id: int) -> Dict[str, str]:
     url = f"https://www.acmicpc.net/problem/{problem_id}"
     try:
-        html = _http_get_with_headers(url)
-        desc_html   = _extract_div(html, "problem_description")
-        input_html  = _extract_div(html, "problem_input")
-        output_html = _extract_div(html, "problem_output")
-        sample_inputs  = re.findall(r'<pre[^>]*id="sample-input-\d+"[^>]*>(.*?)</pre>', html, re.S | re.I)
-        sample_outputs = re.findall(r'<pre[^>]*id="sample-output-\d+"[^>]*>(.*?)</pre>', html, re.S | re.I)
-
-        h2t = html2text.HTML2Text()
-        h2t.ignore_links = False
-        h2t.body_width = 0
-
-        def to_md(h: str) -> str:
-            if not h: return ""
-            return h2t.handle(unescape(h)).strip()
+        html = _load_cached_html(problem_id)
+        if html is None:
+            html = _http_get_with_headers(url)
+            _store_cached_html(problem_id, html)
+
+        if _HTMLParser is not None:
+            # C 파서로 트리를 한 번만 만들고 네 섹션을 모두 질의한다
+            # (정규식의 중첩 <div> 오탐도 함께 해결)
+            tree = _HTMLParser(html)
+
+            def _sec_md(div_id: str) -> str:
+                node = tree.css_first(f"#{div_id}")
+                return to_markdown(node.html) if node else ""
+
+            def _sample_no(n) -> int:
+                sid = (n.attributes.get("id") or "").rsplit("-", 1)[-1]
+                return int(sid) if sid.isdigit() else 0
+
+            def _samples(prefix: str) -> List[str]:
+                nodes = sorted(tree.css(f'pre[id^="{prefix}"]'), key=_sample_no)
+                return [n.text(deep=True).strip() for n in nodes]
+
+            return {
+                "url": url,
+                "description": _sec_md("problem_description") or "(설명을 가져오지 못했습니다.)",
+                "input": _sec_md("problem_input"),
+                "output": _sec_md("problem_output"),
+                "samples_in": _samples("sample-input-"),
+                "samples_out": _samples("sample-output-"),
+            }
+
+        divs: Dict[str, str] = {}
+        samples: Dict[str, List[Tuple[int, str]]] = {"input": [], "output": []}
+        for m in _PAGE_RE.finditer(html):
+            if m.group(1):
+                divs.setdefault(m.group(1).lower(), m.group(2).strip())
+            else:
+                samples[m.group(3).lower()].append((int(m.group(4)), m.group(5)))
 
         return {
             "url": url,
-            "description": to_md(desc_html) or "(설명을 가져오지 못했습니다.)",
-            "input": to_md(input_html),
-            "output": to_md(output_html),
-            "samples_in": [to_md(s) for s in sample_inputs],
-            "samples_out": [to_md(s) for s in sample_outputs],
+            "description": to_markdown(divs.get("problem_description", "")) or "(설명을 가져오지 못했습니다.)",
+            "input": to_markdown(divs.get("problem_input", "")),
+            "output": to_markdown(divs.get("problem_output", "")),
+            "samples_in": [_strip_tags(s) for _, s in sorted(samples["input"])],
+            "samples_out": [_strip_tags(s) for _, s in sorted(samples["output"])],
         }
     except Exception as e:
         return {
             "url": url,
-            "description": f"(문제 페이지 요청 오류: {e})",
+            "description": f"{_FETCH_ERR_PREFIX}: {e})",
             "input": "",
             "output": "",
             "samples_in": [],
             "samples_out": [],
         }
 
-def write_problem_md(problem_dir: str, problem_id: int, title: str):
-    sec = fetch_problem_sections(problem_id)
-    lines: List[str] = []
-    lines.append(f"# [{problem_id}] {title}")
-    lines.append("")
-    lines.append(f"- URL: {sec['url']}")
-    lines.append("")
-    lines.append("## 문제 설명")
-    lines.append("")
-    lines.append(sec["description"] or "(내용 없음)")
-    if sec["input"]:
-        lines.append("\n## 입력\n")
-        lines.append(sec["input"])
-    if sec["output"]:
-        lines.append("\n## 출력\n")
-        lines.append(sec["output"])
-    if sec["samples_in"] or sec["samples_out"]:
-        lines.append("\n## 예제")
-        nmax = max(len(sec["samples_in"]), len(sec["samples_out"]))
-        for i in range(nmax):
-            sin = sec["samples_in"][i] if i < len(sec["samples_in"]) else ""
-            sout= sec["samples_out"][i] if i < len(sec["samples_out"]) else ""
-            n = i + 1
-            if sin:
-                lines.append(f"\n### 예제 입력 {n}\n")
-                lines.append("```\n" + sin.strip() + "\n```")
-            if sout:
-                lines.append(f"\n### 예제 출력 {n}\n")
-                lines.append("```\n" + sout.strip() + "\n```")
+def write_problem_md(problem_dir: str, problem_id: int, title: str, sections: Dict[str, str]):
+    # 이전 실행이 이미 만든 문서면 그대로 둔다(지문은 불변, 빈 껍데기만 재생성).
+    # 단, 오류 플레이스홀더가 적힌 문서는 정상 문서로 치지 않고 다시 쓰며,
+    # --no-cache면 무조건 다시 쓴다 — 실패가 파일에 눌러앉지 않게.
     path = os.path.join(problem_dir, "PROBLEM.md")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    if not NO_CACHE and os.path.exists(path) and os.path.getsize(path) > 64:
+        try:
+            with open(path, encoding="utf-8") as f:
+                head = f.read(2048)
+        except OSError:
+            head = ""
+        if _FETCH_ERR_PREFIX not in head:
+            return
+    # 호출자(ensure_boj_add)가 한 번 가져온 sections를 그대로 받는다 — 여기서 재요청하지 않는다
+    sec = sections
+    # 중간 리스트 없이 파일에 바로 스트리밍(라인 단위 f.write)
+    with open(path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        def w(line: str = ""):
+            f.write(line)
+            f.write("\n")
+
+        w(f"# [{problem_id}] {title}")
+        w()
+        w(f"- URL: {sec['url']}")
+        w()
+        w("## 문제 설명")
+        w()
+        w(sec["description"] or "(내용 없음)")
+        if sec["input"]:
+            w("\n## 입력\n")
+            w(sec["input"])
+        if sec["output"]:
+            w("\n## 출력\n")
+            w(sec["output"])
+        if sec["samples_in"] or sec["samples_out"]:
+            w("\n## 예제")
+            nmax = max(len(sec["samples_in"]), len(sec["samples_out"]))
+            for i in range(nmax):
+                sin = sec["samples_in"][i] if i < len(sec["samples_in"]) else ""
+                sout= sec["samples_out"][i] if i < len(sec["samples_out"]) else ""
+                n = i + 1
+                if sin:
+                    w(f"\n### 예제 입력 {n}\n")
+                    w("```\n" + sin.strip() + "\n```")
+                if sout:
+                    w(f"\n### 예제 출력 {n}\n")
+                    w("```\n" + sout.strip() + "\n```")
 
 # ------------------------------------------------------------
-# 5) 문제 폴더 준비(boj add + 보강)
+# 5) 문제 폴더 준비(직접 생성, 옵션으로 boj add)
 # ------------------------------------------------------------
+# boj-cli 서브프로세스는 호출당 인터프리터 기동 비용이 수백 ms라
+# 기본값은 직접 폴더/파일 생성. `--use-boj-cli`로 이전 동작을 쓸 수 있다.
+USE_BOJ_CLI = "--use-boj-cli" in sys.argv
+
+LANG_MAIN = {"py": "main.py", "cpp": "main.cc", "java": "Main.java"}
+
+# 병렬 준비 중 출력이 섞이지 않도록 stdout 보호
+_PRINT_LOCK = threading.Lock()
+
+def _is_empty_dir(p: str) -> bool:
+    # listdir처럼 전체 엔트리를 모으지 않고 첫 엔트리만 보고 바로 답한다
+    try:
+        with os.scandir(p) as it:
+            return next(it, None) is None
+    except FileNotFoundError:
+        return True
+
 def ensure_boj_add(problem_id: int,
                    lang_flag: str = None,
                    title: str = "",
-                   save_pdf: bool = False):
-    def _run_local(cmd, cwd=None):
-        return subprocess.run(cmd, check=False, capture_output=True, text=True, cwd=cwd)
-
-    problem_dir = resolve_problem_dir(problem_id)
+                   save_pdf: bool = False,
+                   sections: Dict[str, str] = None,
+                   ongoing_base: str = None):
+    problem_dir = resolve_problem_dir(problem_id, ongoing_base)
     os.makedirs(problem_dir, exist_ok=True)
 
-    # boj add 시도
-    add_cmd = BOJ_CMD + ["add", str(problem_id)]
-    if lang_flag:
-        add_cmd = BOJ_CMD + ["add", "--type", lang_flag, str(problem_id)]
-    res = _run_local(add_cmd)
-    if res.returncode != 0:
-        # --type 없이 재시도
-        res2 = _run_local(BOJ_CMD + ["add", str(problem_id)])
-        if res2.returncode != 0:
-            print(f"[warn] boj add 실패. 직접 폴더/파일 생성으로 진행합니다.\n{(res2.stderr or res.stderr).strip()}")
-            # 최소 파일 보장
-            lang_map = {"py": "main.py", "cpp": "main.cc", "java": "Main.java"}
-            filename = lang_map.get(lang_flag or "py", "main.py")
-            main_path = os.path.join(problem_dir, filename)
-            if not os.path.exists(main_path):
-                open(main_path, "w", encoding="utf-8").close()
-            os.makedirs(os.path.join(problem_dir, "testcases"), exist_ok=True)
-        # ongoing_dir 반영
-        problem_dir = resolve_problem_dir(problem_id)
+    filename = LANG_MAIN.get(lang_flag or "py", "main.py")
+
+    # main 파일이 이미 있으면(일괄 boj add / 이전 실행) 개별 add는 생략
+    if USE_BOJ_CLI and not os.path.exists(os.path.join(problem_dir, filename)):
+        # boj add 시도 (--type 실패 시 없이 재시도)
+        add_cmd = BOJ_CMD + ["add", str(problem_id)]
+        if lang_flag:
+            add_cmd = BOJ_CMD + ["add", "--type", lang_flag, str(problem_id)]
+        res = _run(add_cmd)
+        if res.returncode != 0:
+            res2 = _run(BOJ_CMD + ["add", str(problem_id)])
+            if res2.returncode != 0:
+                with _PRINT_LOCK:
+                    print(f"[warn] boj add 실패. 직접 폴더/파일 생성으로 진행합니다.\n{(res2.stderr or res.stderr).strip()}")
+            # ongoing_dir 반영
+            problem_dir = resolve_problem_dir(problem_id, ongoing_base)
+            os.makedirs(problem_dir, exist_ok=True)
 
     # 언어별 main 파일 보호 생성
-    lang_map = {"py": "main.py", "cpp": "main.cc", "java": "Main.java"}
-    if (lang_flag in lang_map) and not os.path.exists(os.path.join(problem_dir, lang_map[lang_flag])):
-        open(os.path.join(problem_dir, lang_map[lang_flag]), "w", encoding="utf-8").close()
+    main_path = os.path.join(problem_dir, filename)
+    if not os.path.exists(main_path):
+        open(main_path, "w", encoding="utf-8").close()
+
+    # 문제 페이지는 한 번만 가져와서 PROBLEM.md와 testcases에 함께 쓴다
+    if sections is None:
+        sections = fetch_problem_sections(problem_id)
 
     # PROBLEM.md 작성
-    write_problem_md(problem_dir, problem_id, title or "")
+    write_problem_md(problem_dir, problem_id, title or "", sections)
 
-    # 샘플 케이스(가능 시)
+    # 샘플 테스트케이스 — 파싱해 둔 예제를 바로 기록(boj case 재다운로드 불필요)
     tc_dir = os.path.join(problem_dir, "testcases")
-    if not os.path.isdir(tc_dir) or not os.listdir(tc_dir):
-        res3 = _run_local(BOJ_CMD + ["case"], cwd=problem_dir)
-        if res3.returncode != 0:
-            os.makedirs(tc_dir, exist_ok=True)
-
-    # (옵션) PDF 저장
+    os.makedirs(tc_dir, exist_ok=True)
+    if _is_empty_dir(tc_dir):
+        sins  = sections.get("samples_in", [])
+        souts = sections.get("samples_out", [])
+        for i in range(min(len(sins), len(souts))):
+            with open(os.path.join(tc_dir, f"{i+1}.in"), "w", encoding="utf-8") as f:
+                f.write(sins[i].strip() + "\n")
+            with open(os.path.join(tc_dir, f"{i+1}.out"), "w", encoding="utf-8") as f:
+                f.write(souts[i].strip() + "\n")
+
+    # (옵션) PDF 저장 — URL도 sections에서 재사용
     if save_pdf and shutil.which("wkhtmltopdf"):
         try:
             subprocess.run(["wkhtmltopdf",
-                            f"https://www.acmicpc.net/problem/{problem_id}",
+                            sections.get("url") or f"https://www.acmicpc.net/problem/{problem_id}",
                             os.path.join(problem_dir, "statement.pdf")],
                            check=True)
         except Exception as e:
@@ -432,43 +823,56 @@ def ensure_boj_add(problem_id: int,
 # 6) 시험 공지 마크다운
 # ------------------------------------------------------------
 def md_announce(picked: List[Dict], duration: int, buckets_info: List[Tuple[str,str,int]]) -> str:
-    lines = []
-    lines.append("# 모의 코딩테스트")
-    lines.append("")
-    lines.append(f"- **제한시간**: {duration}분")
-    lines.append(f"- **문항수**: {len(picked)}")
-    lines.append("")
-    lines.append("## 버킷 구성")
-    for name, rng, cnt in buckets_info:
-        lines.append(f"- {name}: {rng} x {cnt}")
-    lines.append("")
-    lines.append("## 규칙")
-    lines.append("- 각 문제 폴더로 이동해서 main 수정하기")
-    lines.append("- 문서 위치에서 `boj run`으로 샘플 테스트")
-    lines.append("- 풀이 완료 후 `boj submit`으로 제출")
-    lines.append("- 인터넷 검색은 표준 라이브러리 문서 정도로 제한")
-    lines.append("")
-    lines.append("## 문제")
-    for i, p in enumerate(picked, 1):
+    # 줄마다 append하는 대신 블록 단위 f-string + join으로 한 번에 조립
+    def _q(i: int, p: Dict) -> str:
         pid = p["problemId"]; title = p.get("titleKo") or p.get("title") or ""
         level = p.get("level") or 0
-        lines.append(f"**Q{i}. [{pid}] {title}** ({tier_name(level)})  \nhttps://www.acmicpc.net/problem/{pid}")
-    return "\n".join(lines)
+        return f"**Q{i}. [{pid}] {title}** ({tier_name(level)})  \nhttps://www.acmicpc.net/problem/{pid}"
+    parts = [
+        "# 모의 코딩테스트\n",
+        f"- **제한시간**: {duration}분",
+        f"- **문항수**: {len(picked)}\n",
+        "## 버킷 구성",
+        "\n".join(f"- {name}: {rng} x {cnt}" for name, rng, cnt in buckets_info) + "\n",
+        "## 규칙\n"
+        "- 각 문제 폴더로 이동해서 main 수정하기\n"
+        "- 문서 위치에서 `boj run`으로 샘플 테스트\n"
+        "- 풀이 완료 후 `boj submit`으로 제출\n"
+        "- 인터넷 검색은 표준 라이브러리 문서 정도로 제한\n",
+        "## 문제",
+        "\n".join(_q(i, p) for i, p in enumerate(picked, 1)),
+    ]
+    return "\n".join(parts)
 
 # ------------------------------------------------------------
 # 7) 선택/결정론
 # ------------------------------------------------------------
-def deterministic_pick(pool: List[Dict], exam_code: str, salt: str, count: int) -> List[Dict]:
-    picked = []
-    if not pool or count <= 0: return picked
-    h = hashlib.blake2b(digest_size=16)
-    h.update((exam_code + "|" + salt).encode("utf-8"))
-    seed = int.from_bytes(h.digest(), "big")
+def deterministic_pick(pool: List[Dict], exam_code: str, salt: str, count: int,
+                       exclude: set = None) -> List[Dict]:
+    # 앞칸부터 채우는 부분 Fisher–Yates — 전체 셔플(O(N)) 대신 뽑은 만큼만 일한다.
+    # exclude에 있는 problemId가 걸리면 셔플 순서상 다음 후보로 넘어간다.
+    n = len(pool)
+    if n == 0 or count <= 0: return []
+    # 64비트면 이 용도(세트당 수 개 선택)의 충돌 걱정은 없고, blake2s가 짧은
+    # 입력에는 blake2b보다 빠르다
+    seed = int.from_bytes(hashlib.blake2s(f"{exam_code}|{salt}".encode("utf-8"),
+                                          digest_size=8).digest(), "big")
     rng = random.Random(seed)
-    idxs = list(range(len(pool)))
-    rng.shuffle(idxs)
-    for i in idxs[:min(count, len(pool))]:
-        picked.append(pool[i])
+    exclude = exclude or set()
+    # 지연 Fisher–Yates: 전체 인덱스 리스트 대신 실제로 스왑된 칸만 dict에 기록
+    # → 메모리/작업량이 풀 크기가 아니라 뽑은(+건너뛴) 개수에 비례한다
+    swapped: Dict[int, int] = {}
+    picked: List[Dict] = []
+    for i in range(n):
+        j = rng.randrange(i, n)
+        v = swapped.get(j, j)
+        swapped[j] = swapped.get(i, i)
+        cand = pool[v]
+        if cand.get("problemId") in exclude:
+            continue
+        picked.append(cand)
+        if len(picked) == count:
+            break
     return picked
 
 def resolve_buckets_from_preset(preset: str) -> List[Tuple[str,str,int]]:
@@ -482,6 +886,9 @@ def resolve_buckets_from_preset(preset: str) -> List[Tuple[str,str,int]]:
 # 8) 메인
 # ------------------------------------------------------------
 def main():
+    # 의존성 확인/설치는 실제 실행이 확정된 여기서 한다
+    _ensure_deps()
+
     print("시험 코드(exam-code)를 입력하세요 : ", end="")
     exam_code = (input() or "").strip()
     while not exam_code:
@@ -506,13 +913,17 @@ def main():
     os.makedirs(pool_dir, exist_ok=True)
 
     def pool_path(name: str) -> str:
-        return os.path.join(pool_dir, f"pool_{name}.json")
+        # 기존 .json 스냅샷은 그대로 읽고, zstandard가 있으면 새 버킷은 .json.zst로
+        plain = os.path.join(pool_dir, f"pool_{name}.json")
+        if zstd is None or os.path.exists(plain):
+            return plain
+        return plain + ".zst"
 
     buckets = resolve_buckets_from_preset(diff)
     tags: List[str] = []
 
-    pools = []
-    for name, rng, cnt in buckets:
+    def bucket_pool(bucket: Tuple[str, str, int]) -> Tuple[str, str, int, List[Dict]]:
+        name, rng, cnt = bucket
         pj = load_json(pool_path(name), None)
         if not pj:
             # 즉석 생성
@@ -522,15 +933,20 @@ def main():
                   "tags": tags, "updated_at": datetime.now().isoformat(), "items": cands}
             save_json(pool_path(name), pj)
             print(f"[ok] '{name}' 버킷을 새로 수집했습니다. ({len(cands)}개 후보)")
-        items = pj.get("items", [])
-        pools.append((name, rng, cnt, items))
+        return (name, rng, cnt, pj.get("items", []))
 
-    # 3) 문제 결정
+    # 버킷끼리도 병렬 수집 — map이 입력 순서를 보존하므로 pools 순서는 그대로다
+    with ThreadPoolExecutor(max_workers=len(buckets)) as ex:
+        pools = list(ex.map(bucket_pool, buckets))
+
+    # 3) 문제 결정 — 버킷 간 같은 문제가 중복으로 뽑히지 않도록 전역 집합으로 거른다
     picked_all: List[Dict] = []
+    picked_ids: set = set()
     for name, rng, cnt, items in pools:
-        chosen = deterministic_pick(items, exam_code, name, cnt)
+        chosen = deterministic_pick(items, exam_code, name, cnt, exclude=picked_ids)
         if len(chosen) < cnt:
             print(f"[warn] '{name}' 버킷 후보 부족({len(items)}개) → 가능한 만큼만 선택")
+        picked_ids.update(p["problemId"] for p in chosen)
         picked_all.extend(chosen)
 
     # 4) 공지 작성
@@ -542,14 +958,38 @@ def main():
 
     # 5) BOJ 설정 및 문제 폴더 생성
     switch_boj_default_filetype(lang)  # 'py'/'cpp'/'java' or None
-    for p in picked_all:
+
+    # 문제 페이지를 병렬로 미리 받아 둔다(네트워크 I/O 겹치기)
+    sections_by_pid: Dict[int, Dict] = {}
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        fetched = ex.map(lambda p: fetch_problem_sections(p["problemId"]), picked_all)
+        for p, sec in zip(picked_all, fetched):
+            sections_by_pid[p["problemId"]] = sec
+
+    # base 경로는 루프 밖에서 한 번만 계산(문제마다 config 재조회 방지)
+    ongoing_base = resolve_ongoing_base()
+
+    # boj-cli 사용 시, 여러 ID를 받는 버전이면 add를 한 번에 몰아서 호출
+    if USE_BOJ_CLI and picked_all and _boj_cli_caps(need_add_probe=True).get("add_multi"):
+        ids = [str(p["problemId"]) for p in picked_all]
+        add_cmd = BOJ_CMD + ["add"] + (["--type", lang] if lang else []) + ids
+        _run(add_cmd)
+
+    # 문제 폴더 준비도 문제별로 독립이므로 병렬 실행
+    def _prepare(p: Dict):
         ensure_boj_add(
             p["problemId"],
             lang_flag=lang,
             title=p.get("titleKo") or p.get("title") or "",
-            save_pdf=False
+            save_pdf=False,
+            sections=sections_by_pid.get(p["problemId"]),
+            ongoing_base=ongoing_base
         )
 
+    if picked_all:
+        with ThreadPoolExecutor(max_workers=min(8, len(picked_all))) as ex:
+            list(ex.map(_prepare, picked_all))
+
     # 6) 안내
     print("\n=== 준비 완료! ===")
     print("- 아래 폴더로 이동해서 `boj run` 실행 → 샘플 테스트 확인")